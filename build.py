@@ -1,9 +1,10 @@
 #!/usr/bin/env python3
 import sys
 from PyQt6.QtWidgets import QApplication
-from converter_app import MainWindow
+from converter_app import MainWindow, check_and_install_dependencies
 
 def main():
+    check_and_install_dependencies()
     app = QApplication(sys.argv)
     window = MainWindow()
     window.show()
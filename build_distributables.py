@@ -4,6 +4,7 @@ Build script for creating macOS .app and Windows .exe distributables
 for the MP3 to WAV Converter application.
 """
 
+import io
 import os
 import sys
 import platform
@@ -14,6 +15,9 @@ import zipfile
 import tempfile
 from pathlib import Path
 import json
+from concurrent.futures import ThreadPoolExecutor
+
+COPY_BUFFER_SIZE = 1 << 20
 
 class BuildConfig:
     """Configuration for the build process."""
@@ -83,16 +87,20 @@ class BuildManager:
             "requests>=2.25"
         ]
         
-        for dep in dependencies:
-            try:
-                subprocess.check_call([
-                    sys.executable, "-m", "pip", "install", dep
-                ])
-                self.log(f"Installed {dep}")
-            except subprocess.CalledProcessError as e:
-                self.log(f"Failed to install {dep}: {e}", "ERROR")
-                return False
-                
+        self.log(f"Requested: {', '.join(dependencies)}")
+        
+        # Resolve all dependencies in a single pip run
+        try:
+            subprocess.check_call([
+                sys.executable, "-m", "pip", "install",
+                "--disable-pip-version-check", "--no-input",
+                *dependencies
+            ])
+            self.log("Build dependencies installed")
+        except subprocess.CalledProcessError as e:
+            self.log(f"Failed to install build dependencies: {e}", "ERROR")
+            return False
+            
         return True
         
     def download_ffmpeg(self):
@@ -104,64 +112,56 @@ class BuildManager:
             return False
             
         url = self.config.ffmpeg_urls[self.platform]
-        ffmpeg_zip = f"ffmpeg_{self.platform}.zip"
+        partial_path = None
         
         try:
             # Create ffmpeg directory
             os.makedirs(self.config.ffmpeg_dir, exist_ok=True)
             
-            # Download FFmpeg
-            self.log(f"Downloading from {url}")
-            urllib.request.urlretrieve(url, ffmpeg_zip)
-            
-            # Extract FFmpeg
-            with zipfile.ZipFile(ffmpeg_zip, 'r') as zip_ref:
-                zip_ref.extractall(self.config.ffmpeg_dir)
+            target_path = os.path.join(self.config.ffmpeg_dir, "ffmpeg")
+            if self.is_windows:
+                target_path += ".exe"
+            partial_path = target_path + ".part"
                 
-            # Find and move ffmpeg binary
-            ffmpeg_binary = self._find_ffmpeg_binary()
-            if ffmpeg_binary:
-                target_path = os.path.join(self.config.ffmpeg_dir, "ffmpeg")
-                if self.is_windows:
-                    target_path += ".exe"
-                    
-                shutil.move(ffmpeg_binary, target_path)
-                os.chmod(target_path, 0o755)
-                self.log(f"FFmpeg installed to {target_path}")
-                
-            # Clean up
-            os.remove(ffmpeg_zip)
-            self._cleanup_ffmpeg_extract()
+            # Download FFmpeg into memory and extract it from there,
+            # without writing the archive to disk first
+            self.log(f"Downloading from {url}")
+            with urllib.request.urlopen(url) as response, io.BytesIO() as buffer:
+                shutil.copyfileobj(response, buffer, COPY_BUFFER_SIZE)
+                buffer.seek(0)
+                with zipfile.ZipFile(buffer, 'r') as zip_ref:
+                    # Extract only the ffmpeg binary, skipping docs and licenses
+                    member = self._find_ffmpeg_member(zip_ref)
+                    if member is None:
+                        self.log("FFmpeg binary not found in the archive", "ERROR")
+                        return False
+                    # Write next to the target and rename it into place, so an
+                    # interrupted extraction never leaves a truncated binary.
+                    # Reading in COPY_BUFFER_SIZE chunks makes ZipExtFile inflate
+                    # large blocks instead of its 4 KiB minimum read size.
+                    with zip_ref.open(member) as src, \
+                            open(partial_path, 'wb', buffering=COPY_BUFFER_SIZE) as dst:
+                        shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+                        
+            os.chmod(partial_path, 0o755)
+            os.replace(partial_path, target_path)
+            self.log(f"FFmpeg installed to {target_path}")
             
             return True
             
         except Exception as e:
             self.log(f"Failed to download FFmpeg: {e}", "ERROR")
+            if partial_path and os.path.exists(partial_path):
+                os.remove(partial_path)
             return False
             
-    def _find_ffmpeg_binary(self):
-        """Find the FFmpeg binary in the extracted files."""
-        for root, dirs, files in os.walk(self.config.ffmpeg_dir):
-            for file in files:
-                if file == "ffmpeg" or file == "ffmpeg.exe":
-                    return os.path.join(root, file)
+    def _find_ffmpeg_member(self, zip_ref):
+        """Find the FFmpeg binary among the archive members."""
+        for info in zip_ref.infolist():
+            if os.path.basename(info.filename) in ("ffmpeg", "ffmpeg.exe"):
+                return info
         return None
         
-    def _cleanup_ffmpeg_extract(self):
-        """Clean up unnecessary files from FFmpeg extraction."""
-        # Remove empty directories and unnecessary files
-        for root, dirs, files in os.walk(self.config.ffmpeg_dir, topdown=False):
-            for file in files:
-                if file.endswith(('.txt', '.md', '.html')):
-                    os.remove(os.path.join(root, file))
-            for dir_name in dirs:
-                dir_path = os.path.join(root, dir_name)
-                try:
-                    if not os.listdir(dir_path):
-                        os.rmdir(dir_path)
-                except OSError:
-                    pass
-                    
     def create_icons(self):
         """Create platform-specific icons."""
         self.log("Creating icons...")
@@ -185,28 +185,47 @@ class BuildManager:
             self.log("PIL/Pillow not available for icon creation", "WARNING")
             return True
             
+    def _render_icon_sizes(self, sizes):
+        """Resize the source icon to each size, largest first.
+        
+        Every size is downsampled from the previous (larger) result rather
+        than from the full-resolution source image.
+        """
+        from PIL import Image
+        
+        # Load source image and convert it once for all sizes
+        current = Image.open(self.config.icon_png).convert("RGBA")
+        
+        rendered = {}
+        for size in sorted(set(sizes), reverse=True):
+            current = current.resize((size, size), Image.Resampling.LANCZOS)
+            rendered[size] = current
+        return rendered
+        
     def _create_icns_icon(self):
         """Create ICNS icon for macOS."""
         try:
-            from PIL import Image
-            
             # Create iconset directory
             iconset_dir = "icon.iconset"
             os.makedirs(iconset_dir, exist_ok=True)
             
-            # Load source image
-            img = Image.open(self.config.icon_png)
-            
             # Create icons of different sizes
             sizes = self.config.icon_sizes['darwin']
-            for size in sizes:
-                resized = img.resize((size, size), Image.Resampling.LANCZOS)
+            rendered = self._render_icon_sizes(sizes)
+            
+            def save_png(item):
+                size, resized = item
                 resized.save(f"{iconset_dir}/icon_{size}x{size}.png")
                 
                 # Create @2x versions for retina displays
                 if size <= 512:
                     resized.save(f"{iconset_dir}/icon_{size//2}x{size//2}@2x.png")
                     
+            # PNG encoding releases the GIL, so the files are written in parallel
+            workers = min(len(rendered), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(save_png, rendered.items()))
+                
             # Convert to ICNS
             subprocess.check_call(['iconutil', '-c', 'icns', iconset_dir])
             shutil.move('icon.icns', self.config.icon_icns)
@@ -224,20 +243,17 @@ class BuildManager:
     def _create_ico_icon(self):
         """Create ICO icon for Windows."""
         try:
-            from PIL import Image
-            
-            # Load source image
-            img = Image.open(self.config.icon_png)
-            
             # Create ICO with multiple sizes
             sizes = self.config.icon_sizes['win32']
-            icons = []
-            for size in sizes:
-                resized = img.resize((size, size), Image.Resampling.LANCZOS)
-                icons.append(resized)
+            icons = list(self._render_icon_sizes(sizes).values())
                 
-            # Save as ICO
-            icons[0].save(self.config.icon_ico, format='ICO', sizes=[(s, s) for s in sizes])
+            # Save as ICO, starting from the largest image so no size is skipped
+            icons[0].save(
+                self.config.icon_ico,
+                format='ICO',
+                sizes=[icon.size for icon in icons],
+                append_images=icons[1:]
+            )
             
             self.log(f"Created {self.config.icon_ico}")
             return True
@@ -4,7 +4,13 @@ import os
 import subprocess
 import shutil
 import json
+import queue
 import re
+import string
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 def check_and_install_dependencies():
@@ -48,20 +54,36 @@ def configure_qt_plugin_path():
             os.environ.setdefault('QT_PLUGIN_PATH', path)
             break
 
-# Check and install dependencies before importing PyQt6
-check_and_install_dependencies()
+# Check and install dependencies before importing PyQt6 (only when run as a script,
+# so importing the module as a library never forks pip or a package manager)
+if __name__ == "__main__":
+    check_and_install_dependencies()
 configure_qt_plugin_path()
 
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QPushButton, QVBoxLayout, 
                             QWidget, QFileDialog, QLabel, QProgressBar, QTextEdit,
-                            QMessageBox)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+                            QMessageBox, QCheckBox)
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
 
+@lru_cache(maxsize=8)
+def ensure_executable(path):
+    """Set the executable bit on a binary if it is missing (checked once per path)."""
+    try:
+        mode = os.stat(path).st_mode
+        if not mode & 0o111:
+            os.chmod(path, mode | 0o755)
+    except OSError:
+        return False
+    return True
+
+@lru_cache(maxsize=1)
 def get_ffmpeg_path():
-    """Get the path to FFmpeg executable."""
+    """Get the path to FFmpeg executable (resolved once per process)."""
     if getattr(sys, 'frozen', False):
         # Running in a bundle
-        return os.path.join(sys._MEIPASS, 'ffmpeg')
+        ffmpeg_path = os.path.join(sys._MEIPASS, 'ffmpeg')
+        ensure_executable(ffmpeg_path)
+        return ffmpeg_path
     else:
         # Running in normal Python environment
         # Try to find FFmpeg in system PATH
@@ -75,16 +97,16 @@ def get_ffmpeg_path():
             '/opt/homebrew/bin/ffmpeg',
             '/opt/local/bin/ffmpeg'
         ]
-        for path in common_paths:
-            if os.path.exists(path):
-                return path
-        return 'ffmpeg'  # Last resort, let the system PATH handle it
+        # Last resort, let the system PATH handle it
+        return next((path for path in common_paths if os.path.exists(path)), 'ffmpeg')
 
+@lru_cache(maxsize=8)
 def get_ffprobe_path(ffmpeg_path=None):
-    """Get the path to FFprobe executable (if available)."""
+    """Get the path to FFprobe executable (if available, resolved once per ffmpeg path)."""
     if getattr(sys, 'frozen', False):
         bundled = os.path.join(sys._MEIPASS, 'ffprobe')
         if os.path.exists(bundled):
+            ensure_executable(bundled)
             return bundled
     ffprobe_path = shutil.which('ffprobe')
     if ffprobe_path:
@@ -114,43 +136,146 @@ LOSSY_CODECS = {
     "wma", "wmav1", "wmav2",
     "ac3", "eac3"
 }
+# Поддерживаемые форматы
+AUDIO_EXTENSIONS = frozenset({"mp3", "wav", "aac", "m4a", "flac", "ogg", "wma", "aiff", "alac", "tak"})
 LOSSY_EXTENSIONS = {"mp3", "mp2", "aac", "m4a", "ogg", "opus", "wma"}
+# MPEG audio не бывает выше 48 кГц и всегда приводится к 16 бит,
+# поэтому для таких файлов ffprobe ничего не меняет в команде
+UNPROBED_EXTENSIONS = {"mp3"}
 FILTER_CHAIN_PRIMARY = "adeclick,adeclip,anequalizer=c0 f=10000 w=1000 g=-5 t=1"
 FILTER_CHAIN_FALLBACK = "anequalizer=c0 f=10000 w=1000 g=-5 t=1"
+TRANSLIT_TABLE = str.maketrans(
+    'абвгдеёжзийклмнопрстуфхцчшщъыьэюяАБВГДЕЁЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯ',
+    'abvgdeejzijklmnoprstufhzcss_y_euaABVGDEEJZIJKLMNOPRSTUFHZCSS_Y_EUA'
+)
+# [\W_] совпадает ровно с символами, для которых str.isalnum() ложно
+NON_ALNUM_RE = re.compile(r'[\W_]+')
+# То же для ASCII: байты, удаляемые через bytes.translate
+ASCII_NON_ALNUM = bytes(b for b in range(128) if not chr(b).isalnum())
+ASCII_LOWER_TABLE = bytes.maketrans(string.ascii_uppercase.encode(), string.ascii_lowercase.encode())
+SCROLL_DELAY_MS = 50
+PROGRESS_FLUSH_INTERVAL = 0.1  # секунды
+STDERR_TAIL_LINES = 50
+# Разбор вывода "ffmpeg -i", если ffprobe недоступен
+AUDIO_LINE_RE = re.compile(r'^.*Audio:.*$', re.MULTILINE)
+SAMPLE_RATE_RE = re.compile(r'(\d+)\s*Hz')
+SAMPLE_FMT_RE = re.compile(r'\b(s\d{1,2}p?|u\d{1,2}|flt|fltp|dbl|dblp)\b')
+SAMPLE_FMT_BITS_RE = re.compile(r'^[su](\d+)')
+# Разрядность известных форматов сэмплов ffmpeg
+SAMPLE_FMT_BITS = {
+    "u8": 8, "u8p": 8,
+    "s16": 16, "s16p": 16,
+    "s24": 24, "s24p": 24,
+    "s32": 32, "s32p": 32,
+    "s64": 64, "s64p": 64,
+    "flt": 32, "fltp": 32,
+    "dbl": 64, "dblp": 64,
+}
+
+@lru_cache(maxsize=8)
+def get_filter_chains(ffmpeg_path):
+    """Get the filter chains to try, based on the filters FFmpeg supports.
+
+    Detected once per FFmpeg binary so a missing filter does not cost a
+    failed ffmpeg run for every file. If detection fails, both chains are
+    returned and the per-file fallback decides.
+    """
+    try:
+        result = subprocess.run(
+            [ffmpeg_path, "-hide_banner", "-filters"],
+            capture_output=True,
+            text=True
+        )
+    except OSError:
+        return (FILTER_CHAIN_PRIMARY, FILTER_CHAIN_FALLBACK)
+    available = set()
+    for line in result.stdout.splitlines():
+        parts = line.split()
+        if len(parts) > 1:
+            available.add(parts[1])
+    # anull есть в любой сборке; без него список фильтров разобрать не удалось
+    if result.returncode != 0 or "anull" not in available:
+        return (FILTER_CHAIN_PRIMARY, FILTER_CHAIN_FALLBACK)
+    if {"adeclick", "adeclip", "anequalizer"} <= available:
+        return (FILTER_CHAIN_PRIMARY,)
+    if "anequalizer" in available:
+        return (FILTER_CHAIN_FALLBACK,)
+    return ()
+
+def iter_audio_dirs(top, extensions):
+    """Yield (path, names, audio_files) for top and each directory below it.
+
+    Uses os.scandir so entry types come from the directory listing itself
+    instead of a separate stat per entry. Symlinked directories are not
+    followed, matching os.walk defaults.
+    """
+    stack = [top]
+    while stack:
+        path = stack.pop()
+        names = []
+        audio_files = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    names.append(entry.name)
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        _, dot, ext = entry.name.rpartition('.')
+                        if dot and ext.lower() in extensions:
+                            audio_files.append(entry.name)
+        except OSError:
+            continue
+        yield path, names, audio_files
 
 class ConversionWorker(QThread):
     progress = pyqtSignal(str)
+    total_files = pyqtSignal(int)  # количество найденных файлов
+    file_done = pyqtSignal(int)  # количество обработанных файлов
     finished = pyqtSignal(int, int)  # success_count, error_count
     error = pyqtSignal(str)  # New signal for critical errors
 
-    def __init__(self, directory):
+    # Результаты проверки файлов, общие для всех запусков:
+    # путь -> ((mtime, размер), параметры аудио)
+    _audio_info_cache = {}
+
+    def __init__(self, directory, always_convert=False):
         super().__init__()
         self.directory = directory
+        # Всегда приводить к 16 бит / MAX_SAMPLE_RATE без анализа файлов
+        self.always_convert = always_convert
+        # Файлы конвертируются параллельно, поэтому потоки внутри ffmpeg
+        # ограничиваем, чтобы не перегружать процессор
+        cpu_count = os.cpu_count() or 1
+        self.pool_size = max(2, cpu_count)
+        self.ffmpeg_threads = max(1, cpu_count // self.pool_size)
         self.ffmpeg_path = get_ffmpeg_path()
         self.ffprobe_path = get_ffprobe_path(self.ffmpeg_path)
+        self.filter_chains = (FILTER_CHAIN_PRIMARY, FILTER_CHAIN_FALLBACK)
 
-    def transliterate(self, text):
+    @staticmethod
+    def transliterate(text):
         # Транслитерация кириллицы в латиницу
-        text = text.translate(str.maketrans(
-            'абвгдеёжзийклмнопрстуфхцчшщъыьэюяАБВГДЕЁЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯ',
-            'abvgdeejzijklmnoprstufhzcss_y_euaABVGDEEJZIJKLMNOPRSTUFHZCSS_Y_EUA'
-        ))
-        return text
+        return text.translate(TRANSLIT_TABLE)
 
-    def sanitize_filename(self, filename):
+    @staticmethod
+    def sanitize_filename(filename):
         # Транслитерация кириллицы
-        filename = self.transliterate(filename)
+        filename = ConversionWorker.transliterate(filename)
         
-        # Удаляем все специальные символы, оставляем только буквы и цифры
-        filename = ''.join(c for c in filename if c.isalnum())
+        # Удаляем все специальные символы, оставляем только буквы и цифры,
+        # и приводим к нижнему регистру (для ASCII — одним проходом translate)
+        if filename.isascii():
+            filename = filename.encode('ascii').translate(
+                ASCII_LOWER_TABLE, ASCII_NON_ALNUM
+            ).decode('ascii')
+        else:
+            filename = NON_ALNUM_RE.sub('', filename).lower()
         
         # Если имя файла пустое после всех преобразований, используем "untitled"
         if not filename:
             filename = "untitled"
         
-        # Приводим к нижнему регистру
-        filename = filename.lower()
-        
         return filename
 
     def _parse_int(self, value):
@@ -162,10 +287,12 @@ class ConversionWorker(QThread):
     def _sample_fmt_to_bit_depth(self, sample_fmt):
         if not sample_fmt:
             return None
-        if sample_fmt.startswith(("s", "u")):
-            match = re.match(r'[su](\d+)', sample_fmt)
-            if match:
-                return self._parse_int(match.group(1))
+        bits = SAMPLE_FMT_BITS.get(sample_fmt)
+        if bits is not None:
+            return bits
+        match = SAMPLE_FMT_BITS_RE.match(sample_fmt)
+        if match:
+            return int(match.group(1))
         if sample_fmt.startswith("flt"):
             return 32
         if sample_fmt.startswith("dbl"):
@@ -218,19 +345,16 @@ class ConversionWorker(QThread):
                 text=True
             )
             text = result.stderr or result.stdout or ""
-            audio_line = None
-            for line in text.splitlines():
-                if "Audio:" in line:
-                    audio_line = line
-                    break
-            if not audio_line:
+            match = AUDIO_LINE_RE.search(text)
+            if not match:
                 return None
+            audio_line = match.group(0)
             sample_rate = None
-            match = re.search(r'(\d+)\s*Hz', audio_line)
+            match = SAMPLE_RATE_RE.search(audio_line)
             if match:
                 sample_rate = self._parse_int(match.group(1))
             sample_fmt = None
-            match = re.search(r'\b(s\d{1,2}p?|u\d{1,2}|flt|fltp|dbl|dblp)\b', audio_line)
+            match = SAMPLE_FMT_RE.search(audio_line)
             if match:
                 sample_fmt = match.group(1)
             bit_depth = self._sample_fmt_to_bit_depth(sample_fmt)
@@ -244,6 +368,21 @@ class ConversionWorker(QThread):
             return None
 
     def _get_audio_info(self, audiofile):
+        ext = Path(audiofile).suffix.lower().lstrip(".")
+        if ext in UNPROBED_EXTENSIONS:
+            # Параметры по умолчанию дают ту же команду, что и результат проверки
+            return {"sample_rate": None, "sample_fmt": None, "bit_depth": None, "codec_name": None}
+
+        # Повторный запуск (например, после ошибок) не проверяет неизменившиеся файлы заново
+        stat = os.stat(audiofile)
+        cached = self._audio_info_cache.get(audiofile)
+        if cached and cached[0] == (stat.st_mtime_ns, stat.st_size):
+            return cached[1]
+        info = self._probe_audio_info(audiofile)
+        self._audio_info_cache[audiofile] = ((stat.st_mtime_ns, stat.st_size), info)
+        return info
+
+    def _probe_audio_info(self, audiofile):
         info = self._probe_audio_with_ffprobe(audiofile)
         if info:
             return info
@@ -272,31 +411,140 @@ class ConversionWorker(QThread):
             return True
         return codec == ""
 
-    def _is_filter_error(self, stderr_text):
-        if not stderr_text:
+    def _is_filter_error(self, stderr_output):
+        if not stderr_output:
             return False
-        text = stderr_text.lower()
+        # stderr читается как байты и декодируется только при ошибке
+        text = stderr_output.decode("utf-8", errors="replace").lower()
         return "no such filter" in text or "error initializing filter" in text
 
-    def _run_ffmpeg_with_fallbacks(self, cmd, fallback_cmds):
-        result = subprocess.run(
+    def _run_ffmpeg(self, cmd):
+        # Вывод ffmpeg не нужен, из stderr храним только последние строки для анализа ошибок
+        with subprocess.Popen(
             cmd,
-            capture_output=True,
-            text=True
-        )
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE
+        ) as process:
+            tail = deque(process.stderr, maxlen=STDERR_TAIL_LINES)
+            returncode = process.wait()
+        return subprocess.CompletedProcess(cmd, returncode, None, b"".join(tail))
+
+    def _run_ffmpeg_with_fallbacks(self, cmd, fallback_cmds):
+        result = self._run_ffmpeg(cmd)
         if result.returncode == 0:
             return result
         if self._is_filter_error(result.stderr):
             for fallback in fallback_cmds:
-                result = subprocess.run(
-                    fallback,
-                    capture_output=True,
-                    text=True
-                )
+                result = self._run_ffmpeg(fallback)
                 if result.returncode == 0:
                     return result
         return result
 
+    def _collect_jobs(self):
+        jobs = []
+
+        for root, names, audio_files in iter_audio_dirs(self.directory, AUDIO_EXTENSIONS):
+            # Занятые имена в папке; сравниваем без учета регистра,
+            # так как файловая система может быть к нему нечувствительна
+            taken = {name.lower() for name in names}
+            # Следующий свободный суффикс для каждого имени: занятые имена
+            # только добавляются, поэтому меньшие номера проверять не нужно
+            next_counter = {}
+
+            for file in audio_files:
+                filename = os.path.splitext(file)[0]
+                audiofile = os.path.join(root, file)
+
+                # Создаем новое имя файла
+                new_filename = self.sanitize_filename(filename)
+                wav_name = f"{new_filename}.wav"
+
+                # Если файл с таким именем уже существует или зарезервирован, добавляем числовой суффикс
+                counter = next_counter.get(new_filename, 1)
+                while wav_name in taken:
+                    if new_filename == "untitled":
+                        wav_name = f"untitled{counter}.wav"
+                    else:
+                        wav_name = f"{new_filename}_{counter}.wav"
+                    counter += 1
+
+                next_counter[new_filename] = counter
+                taken.add(wav_name)
+                jobs.append((audiofile, os.path.join(root, wav_name)))
+        return jobs
+
+    def _convert_one(self, audiofile, wavfile):
+        # Сообщения по файлу возвращаются вместе с результатом, чтобы не перегружать интерфейс
+        messages = [
+            f"🔄 Конвертация: {audiofile}",
+            f"📝 Новое имя: {wavfile}",
+        ]
+        ok = False
+        # ffmpeg пишет во временный файл, который переименовывается только после успеха,
+        # поэтому недописанный WAV никогда не остается под итоговым именем
+        partfile = wavfile + ".part"
+
+        try:
+            if self.always_convert:
+                # Без ffprobe: формат фиксирован, фильтры выбираются по расширению
+                needs_16bit = needs_resample = True
+                apply_filters = Path(audiofile).suffix.lower().lstrip(".") in LOSSY_EXTENSIONS
+            else:
+                audio_info = self._get_audio_info(audiofile)
+                sample_rate = audio_info.get("sample_rate")
+                bit_depth = audio_info.get("bit_depth")
+                sample_fmt = audio_info.get("sample_fmt")
+
+                needs_16bit = self._needs_16bit(bit_depth, sample_fmt)
+                needs_resample = self._needs_resample(sample_rate)
+                apply_filters = self._should_apply_filters(audiofile, audio_info)
+
+            ffmpeg_cmd = [
+                self.ffmpeg_path, "-nostdin", "-hide_banner",
+                "-loglevel", "error", "-y",
+                "-threads", str(self.ffmpeg_threads),
+                "-filter_threads", str(self.ffmpeg_threads),
+                "-i", audiofile,
+                # Только первая аудиодорожка: обложки и субтитры не декодируются
+                "-map", "0:a:0?", "-vn", "-sn"
+            ]
+            if needs_16bit:
+                ffmpeg_cmd += ["-c:a", "pcm_s16le"]
+            if needs_resample:
+                ffmpeg_cmd += ["-ar", str(MAX_SAMPLE_RATE)]
+            # Формат указываем явно: по расширению .part ffmpeg его не определит
+            ffmpeg_cmd += ["-f", "wav"]
+
+            # Конвертируем файл
+            if apply_filters and self.filter_chains:
+                cmds = [ffmpeg_cmd + ["-af", chain, partfile] for chain in self.filter_chains]
+                no_filters = ffmpeg_cmd + [partfile]
+                result = self._run_ffmpeg_with_fallbacks(cmds[0], cmds[1:] + [no_filters])
+            else:
+                result = self._run_ffmpeg(ffmpeg_cmd + [partfile])
+
+            if result.returncode == 0 and os.path.getsize(partfile) > 0:
+                os.replace(partfile, wavfile)
+                messages.append(f"✅ Успешно: {audiofile} → {wavfile}")
+                os.remove(audiofile)
+                self._audio_info_cache.pop(audiofile, None)
+                ok = True
+            else:
+                messages.append(f"❌ Ошибка при конвертации: {audiofile}")
+        except Exception as e:
+            messages.append(f"❌ Ошибка: {str(e)}")
+        finally:
+            if os.path.exists(partfile):
+                os.remove(partfile)
+
+        return ok, messages
+
+    def _flush_progress(self, messages, done_count):
+        self.progress.emit("\n".join(messages))
+        self.file_done.emit(done_count)
+        messages.clear()
+
     def run(self):
         try:
             if not os.path.exists(self.directory):
@@ -312,82 +560,46 @@ class ConversionWorker(QThread):
                 self.error.emit(f"FFmpeg не найден по пути: {self.ffmpeg_path}")
                 return
 
-            # Делаем FFmpeg исполняемым
-            if os.path.exists(self.ffmpeg_path):
-                os.chmod(self.ffmpeg_path, 0o755)
-            if self.ffprobe_path and os.path.exists(self.ffprobe_path):
-                os.chmod(self.ffprobe_path, 0o755)
+            # Доступные фильтры определяем один раз, а не через ошибки на каждом файле
+            self.filter_chains = get_filter_chains(self.ffmpeg_path)
+
+            jobs = self._collect_jobs()
+            self.total_files.emit(len(jobs))
 
             success_count = 0
             error_count = 0
-            
-            # Поддерживаемые форматы
-            audio_extensions = ["mp3", "wav", "aac", "m4a", "flac", "ogg", "wma", "aiff", "alac", "tak"]
-            
-            for ext in audio_extensions:
-                for root, _, files in os.walk(self.directory):
-                    for file in files:
-                        if file.lower().endswith(f'.{ext}'):
-                            audiofile = os.path.join(root, file)
-                            
-                            # Создаем новое имя файла
-                            filename = os.path.splitext(file)[0]
-                            new_filename = self.sanitize_filename(filename)
-                            wavfile = os.path.join(root, f"{new_filename}.wav")
-                            
-                            # Если файл с таким именем уже существует, добавляем числовой суффикс
-                            counter = 1
-                            while os.path.exists(wavfile):
-                                if new_filename == "untitled":
-                                    wavfile = os.path.join(root, f"untitled{counter}.wav")
-                                else:
-                                    wavfile = os.path.join(root, f"{new_filename}_{counter}.wav")
-                                counter += 1
-                            
-                            self.progress.emit(f"🔄 Конвертация: {audiofile}")
-                            self.progress.emit(f"📝 Новое имя: {wavfile}")
-                            
-                            try:
-                                audio_info = self._get_audio_info(audiofile)
-                                sample_rate = audio_info.get("sample_rate")
-                                bit_depth = audio_info.get("bit_depth")
-                                sample_fmt = audio_info.get("sample_fmt")
-
-                                needs_16bit = self._needs_16bit(bit_depth, sample_fmt)
-                                needs_resample = self._needs_resample(sample_rate)
-
-                                ffmpeg_cmd = [self.ffmpeg_path, "-loglevel", "warning", "-y", "-i", audiofile]
-                                if needs_16bit:
-                                    ffmpeg_cmd += ["-c:a", "pcm_s16le"]
-                                if needs_resample:
-                                    ffmpeg_cmd += ["-ar", str(MAX_SAMPLE_RATE)]
-                                apply_filters = self._should_apply_filters(audiofile, audio_info)
-
-                                # Конвертируем файл
-                                if apply_filters:
-                                    primary = ffmpeg_cmd + ["-af", FILTER_CHAIN_PRIMARY, wavfile]
-                                    fallback = ffmpeg_cmd + ["-af", FILTER_CHAIN_FALLBACK, wavfile]
-                                    no_filters = ffmpeg_cmd + [wavfile]
-                                    result = self._run_ffmpeg_with_fallbacks(primary, [fallback, no_filters])
-                                else:
-                                    result = subprocess.run(
-                                        ffmpeg_cmd + [wavfile],
-                                        capture_output=True,
-                                        text=True
-                                    )
-                                
-                                if result.returncode == 0 and os.path.getsize(wavfile) > 0:
-                                    self.progress.emit(f"✅ Успешно: {audiofile} → {wavfile}")
-                                    os.remove(audiofile)
-                                    success_count += 1
-                                else:
-                                    self.progress.emit(f"❌ Ошибка при конвертации: {audiofile}")
-                                    if os.path.exists(wavfile):
-                                        os.remove(wavfile)
-                                    error_count += 1
-                            except Exception as e:
-                                self.progress.emit(f"❌ Ошибка: {str(e)}")
-                                error_count += 1
+            # Сообщения копятся и отправляются в интерфейс не чаще раза в PROGRESS_FLUSH_INTERVAL
+            pending_messages = []
+            last_flush = 0.0
+
+            # ffmpeg работает в отдельном процессе, поэтому потоков достаточно
+            with ThreadPoolExecutor(max_workers=self.pool_size) as executor:
+                completed = queue.Queue()
+                for audiofile, wavfile in jobs:
+                    future = executor.submit(self._convert_one, audiofile, wavfile)
+                    future.add_done_callback(completed.put)
+                remaining = len(jobs)
+                while remaining:
+                    try:
+                        # Ждем не дольше интервала, чтобы отправить накопленное вовремя
+                        future = completed.get(timeout=PROGRESS_FLUSH_INTERVAL)
+                    except queue.Empty:
+                        future = None
+                    if future is not None:
+                        remaining -= 1
+                        ok, messages = future.result()
+                        pending_messages.extend(messages)
+                        if ok:
+                            success_count += 1
+                        else:
+                            error_count += 1
+                    now = time.monotonic()
+                    if pending_messages and now - last_flush >= PROGRESS_FLUSH_INTERVAL:
+                        self._flush_progress(pending_messages, success_count + error_count)
+                        last_flush = now
+
+            if pending_messages:
+                self._flush_progress(pending_messages, success_count + error_count)
             
             self.finished.emit(success_count, error_count)
         except Exception as e:
@@ -419,6 +631,17 @@ class MainWindow(QMainWindow):
         self.convert_button.setEnabled(False)
         layout.addWidget(self.convert_button)
         
+        # Режим без анализа файлов
+        self.always_convert_checkbox = QCheckBox(
+            f"Всегда {MAX_SAMPLE_RATE // 1000} кГц / 16 бит (без анализа файлов)"
+        )
+        layout.addWidget(self.always_convert_checkbox)
+        
+        # Общий прогресс по файлам
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setValue(0)
+        layout.addWidget(self.progress_bar)
+        
         # Прогресс
         self.progress_text = QTextEdit()
         self.progress_text.setReadOnly(True)
@@ -426,6 +649,7 @@ class MainWindow(QMainWindow):
         
         self.selected_directory = None
         self.worker = None
+        self._scroll_pending = False
 
     def select_directory(self):
         directory = QFileDialog.getExistingDirectory(self, "Выберите папку с аудио файлами")
@@ -444,16 +668,35 @@ class MainWindow(QMainWindow):
         self.convert_button.setEnabled(False)
         self.select_button.setEnabled(False)
         self.progress_text.clear()
+        self.progress_bar.setValue(0)
         
-        self.worker = ConversionWorker(self.selected_directory)
+        self.worker = ConversionWorker(
+            self.selected_directory,
+            always_convert=self.always_convert_checkbox.isChecked()
+        )
         self.worker.progress.connect(self.update_progress)
+        self.worker.total_files.connect(self.set_total_files)
+        self.worker.file_done.connect(self.progress_bar.setValue)
         self.worker.finished.connect(self.conversion_finished)
         self.worker.error.connect(self.handle_error)
         self.worker.start()
 
+    def set_total_files(self, total):
+        # При пустой папке оставляем шкалу конечной, а не "бесконечной"
+        self.progress_bar.setMaximum(max(total, 1))
+        self.progress_bar.setValue(0)
+
     def update_progress(self, message):
+        self.progress_text.setUpdatesEnabled(False)
         self.progress_text.append(message)
-        # Прокручиваем к последней строке
+        self.progress_text.setUpdatesEnabled(True)
+        # Прокрутку к последней строке объединяем, если сообщения идут подряд
+        if not self._scroll_pending:
+            self._scroll_pending = True
+            QTimer.singleShot(SCROLL_DELAY_MS, self._scroll_to_bottom)
+
+    def _scroll_to_bottom(self):
+        self._scroll_pending = False
         self.progress_text.verticalScrollBar().setValue(
             self.progress_text.verticalScrollBar().maximum()
         )
@@ -466,6 +709,7 @@ class MainWindow(QMainWindow):
     def conversion_finished(self, success_count, error_count):
         self.convert_button.setEnabled(True)
         self.select_button.setEnabled(True)
+        self.progress_bar.setValue(self.progress_bar.maximum())
         
         self.progress_text.append(f"\n🎉 Готово! Конвертировано файлов: {success_count}")
         if error_count > 0: